@@ -8,7 +8,7 @@ import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import requests
 import torch
@@ -75,6 +75,26 @@ LEGACY_CONFIGS = {
     },
 }
 
+# parsed YAML files, keyed by path and validated against (st_mtime, st_size)
+_YAML_CACHE: Dict[str, Tuple[float, int, Any]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """
+    Return the parsed contents of a YAML file, reusing the previous parse
+    if the file's modification time and size are unchanged. Callers must
+    treat the returned object as shared.
+    """
+    st = os.stat(path)
+    key = str(path)
+    if cached := _YAML_CACHE.get(key):
+        mtime, size, conf = cached
+        if (mtime, size) == (st.st_mtime, st.st_size):
+            return conf
+    conf = OmegaConf.load(path)
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, conf)
+    return conf
+
 
 @dataclass
 class InstallSelections:
@@ -107,7 +127,7 @@ class ModelInstall(object):
     ):
         self.config = config
         self.mgr = model_manager or ModelManager(config.model_conf_path)
-        self.datasets = OmegaConf.load(Dataset_path)
+        self.datasets = _load_yaml_cached(Dataset_path)
         self.prediction_helper = prediction_type_helper
         self.access_token = access_token or HfFolder.get_token()
         self.reverse_paths = self._reverse_paths(self.datasets)
@@ -123,12 +143,10 @@ class ModelInstall(object):
         model_dict = {}
 
         # first populate with the entries in INITIAL_MODELS.yaml
+        # (self.datasets is shared through the YAML cache, so don't write into it)
         for key, value in self.datasets.items():
             name, base, model_type = ModelManager.parse_key(key)
-            value["name"] = name
-            value["base_type"] = base
-            value["model_type"] = model_type
-            model_info = ModelLoadInfo(**value)
+            model_info = ModelLoadInfo(**{**value, "name": name, "base_type": base, "model_type": model_type})
             if model_info.subfolder and model_info.repo_id:
                 model_info.repo_id += f":{model_info.subfolder}"
             model_dict[key] = model_info
@@ -7,30 +7,34 @@
 """
 This is the npyscreen frontend to the model installation application.
 The work is actually done in backend code in model_install_backend.py.
+
+The backend (and with it torch) is imported only by the functions that use
+it, so that importing this module stays fast.
 """
+from __future__ import annotations
 
 import argparse
 import curses
+import json
 import logging
+import select
+import signal
+import socket
+import struct
 import sys
 import textwrap
 import traceback
 from argparse import Namespace
-from multiprocessing import Process
-from multiprocessing.connection import Connection, Pipe
+from functools import lru_cache, partial
+from multiprocessing import Process, Queue, shared_memory
 from pathlib import Path
 from shutil import get_terminal_size
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import npyscreen
-import torch
 from npyscreen import widget
 
 from invokeai.app.services.config import InvokeAIAppConfig
-from invokeai.backend.install.model_install_backend import InstallSelections, ModelInstall, SchedulerPredictionType
-from invokeai.backend.model_management import ModelManager, ModelType
-from invokeai.backend.util import choose_precision, choose_torch_device
-from invokeai.backend.util.logging import InvokeAILogger
 from invokeai.frontend.install.widgets import (
     MIN_COLS,
     MIN_LINES,
@@ -45,8 +49,11 @@ from invokeai.frontend.install.widgets import (
     set_min_terminal_size,
 )
 
+if TYPE_CHECKING:
+    from invokeai.backend.install.model_install_backend import InstallSelections, SchedulerPredictionType
+    from invokeai.backend.model_management import ModelType
+
 config = InvokeAIAppConfig.get_config()
-logger = InvokeAILogger.get_logger()
 
 # build a table mapping all non-printable characters to None
 # for stripping control characters
@@ -62,6 +69,12 @@ def make_printable(s: str) -> str:
     return s.translate(NOPRINT_TRANS_TABLE)
 
 
+@lru_cache(maxsize=1024)
+def _truncate(description: str, width: int) -> str:
+    """Shorten description to fit in width characters, marking the cut with an ellipsis"""
+    return description if len(description) <= width else description[0 : width - 3] + "..."
+
+
 class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
     # for responsive resizing set to False, but this seems to cause a crash!
     FIX_MINIMUM_SIZE_WHEN_CREATED = True
@@ -71,22 +84,40 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
 
     def __init__(self, parentApp, name, multipage=False, *args, **keywords):
         self.multipage = multipage
-        self.subprocess = None
         super().__init__(parentApp=parentApp, name=name, *args, **keywords)  # noqa: B026 # TODO: maybe this is bad?
 
     def create(self):
+        from invokeai.backend.install.model_install_backend import ModelInstall
+        from invokeai.backend.model_management import ModelType
+
         self.keypress_timeout = 10
         self.counter = 0
         self.subprocess_connection = None
 
-        if not config.model_conf_path.exists():
-            with open(config.model_conf_path, "w") as file:
+        model_conf_path = getattr(self.parentApp, "model_conf_path", None) or config.model_conf_path
+        if not model_conf_path.exists():
+            with open(model_conf_path, "w") as file:
                 print("# InvokeAI model configuration file", file=file)
         self.installer = ModelInstall(config)
         self.all_models = self.installer.all_models()
         self.starter_models = self.installer.starter_models()
+        self._installed_names = {x for x, info in self.all_models.items() if info.installed}
+        # model keys grouped by type and the starter keys, all in display order
+        self._models_by_type: dict[ModelType, list[str]] = {}
+        for key, info in self.all_models.items():
+            self._models_by_type.setdefault(info.model_type, []).append(key)
+        self._starter_keys = [x for x in self.all_models if x in self.starter_models]
+        self.installed_models = sorted(self.starter_models & self._installed_names)
+        # if user has already installed some initial models, then don't patronize them
+        # by showing more recommendations
+        self._show_recommended = len(self.installed_models) == 0
+        self._preselected_names = set(self._installed_names)
+        if self._show_recommended:
+            self._preselected_names.update(x for x, info in self.all_models.items() if info.recommended)
+        self._label_cache: dict[int, dict[str, str]] = {}
+        self._term_size = get_terminal_size()  # refreshed by resize()
         self.model_labels = self._get_model_labels()
-        window_width, window_height = get_terminal_size()
+        window_width, window_height = self._term_size
 
         self.nextrely -= 1
         self.add_widget_intelligent(
@@ -115,50 +146,38 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         )
         self.tabs.on_changed = self._toggle_tables
 
-        top_of_table = self.nextrely
-        self.starter_pipelines = self.add_starter_pipelines()
-        bottom_of_table = self.nextrely
-
-        self.nextrely = top_of_table
-        self.pipeline_models = self.add_pipeline_widgets(
-            model_type=ModelType.Main, window_width=window_width, exclude=self.starter_models
-        )
-        # self.pipeline_models['autoload_pending'] = True
-        bottom_of_table = max(bottom_of_table, self.nextrely)
-
-        self.nextrely = top_of_table
-        self.controlnet_models = self.add_model_widgets(
-            model_type=ModelType.ControlNet,
-            window_width=window_width,
-        )
-        bottom_of_table = max(bottom_of_table, self.nextrely)
-
-        self.nextrely = top_of_table
-        self.t2i_models = self.add_model_widgets(
-            model_type=ModelType.T2IAdapter,
-            window_width=window_width,
-        )
-        bottom_of_table = max(bottom_of_table, self.nextrely)
-        self.nextrely = top_of_table
-        self.ipadapter_models = self.add_model_widgets(
-            model_type=ModelType.IPAdapter,
-            window_width=window_width,
-        )
-        bottom_of_table = max(bottom_of_table, self.nextrely)
+        # model type listed on each tab; the first tab holds the starter models
+        self._tab_model_types = [
+            None,
+            ModelType.Main,
+            ModelType.ControlNet,
+            ModelType.T2IAdapter,
+            ModelType.IPAdapter,
+            ModelType.Lora,
+            ModelType.TextualInversion,
+        ]
 
-        self.nextrely = top_of_table
-        self.lora_models = self.add_model_widgets(
-            model_type=ModelType.Lora,
-            window_width=window_width,
-        )
-        bottom_of_table = max(bottom_of_table, self.nextrely)
+        # Only the current tab is built here. The others are built by _toggle_tables() the
+        # first time they are selected, so space is reserved for the tallest of them.
+        self._tab_builders = [
+            self.add_starter_pipelines,
+            lambda: self.add_pipeline_widgets(
+                model_type=ModelType.Main, window_width=window_width, exclude=self.starter_models
+            ),
+            *[
+                partial(self.add_model_widgets, model_type=model_type, window_width=window_width)
+                for model_type in self._tab_model_types[2:]
+            ],
+        ]
+        self._tab_widgets: list[Optional[dict[str, npyscreen.widget]]] = [None] * len(self._tab_builders)
+        self._top_of_table = self.nextrely
+        self._table_position = len(self._widgets__)
 
-        self.nextrely = top_of_table
-        self.ti_models = self.add_model_widgets(
-            model_type=ModelType.TextualInversion,
-            window_width=window_width,
-        )
-        bottom_of_table = max(bottom_of_table, self.nextrely)
+        self._tab_widgets[self.current_tab] = self._tab_builders[self.current_tab]()
+        bottom_of_table = self.nextrely
+        for tab in range(len(self._tab_builders)):
+            if tab != self.current_tab:
+                bottom_of_table = max(bottom_of_table, self._top_of_table + self._tab_height(tab, window_width))
 
         self.nextrely = bottom_of_table + 1
 
@@ -168,6 +187,7 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
             editable=False,
             max_height=6,
         )
+        self._wrapper = textwrap.TextWrapper(width=self.monitor.entry_widget.width, subsequent_indent="   ")
 
         self.nextrely += 1
         done_label = "APPLY CHANGES"
@@ -211,12 +231,9 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
     def add_starter_pipelines(self) -> dict[str, npyscreen.widget]:
         """Add widgets responsible for selecting diffusers models"""
         widgets = {}
-        models = self.all_models
         starters = self.starter_models
         starter_model_labels = self.model_labels
 
-        self.installed_models = sorted([x for x in starters if models[x].installed])
-
         widgets.update(
             label1=self.add_widget_intelligent(
                 CenteredTitleText,
@@ -227,21 +244,14 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         )
 
         self.nextrely -= 1
-        # if user has already installed some initial models, then don't patronize them
-        # by showing more recommendations
-        show_recommended = len(self.installed_models) == 0
-        keys = [x for x in models.keys() if x in starters]
+        keys = self._starter_keys
         widgets.update(
             models_selected=self.add_widget_intelligent(
                 MultiSelectColumns,
                 columns=1,
                 name="Install Starter Models",
                 values=[starter_model_labels[x] for x in keys],
-                value=[
-                    keys.index(x)
-                    for x in keys
-                    if (show_recommended and models[x].recommended) or (x in self.installed_models)
-                ],
+                value=self._preselected(keys),
                 max_height=len(starters) + 1,
                 relx=4,
                 scroll_exit=True,
@@ -264,15 +274,12 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         if exclude is None:
             exclude = set()
         widgets = {}
-        model_list = [x for x in self.all_models if self.all_models[x].model_type == model_type and x not in exclude]
+        model_list = [x for x in self._models_by_type.get(model_type, []) if x not in exclude]
         model_labels = [self.model_labels[x] for x in model_list]
 
-        show_recommended = len(self.installed_models) == 0
         truncated = False
         if len(model_list) > 0:
-            max_width = max([len(x) for x in model_labels])
-            columns = window_width // (max_width + 8)  # 8 characters for "[x] " and padding
-            columns = min(len(model_list), columns) or 1
+            columns, rows = self._model_table_layout(model_list, window_width)
             prompt = (
                 install_prompt
                 or f"Select the desired {model_type.value.title()} models to install. Unchecked models will be purged from disk."
@@ -297,12 +304,8 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
                     columns=columns,
                     name=f"Install {model_type} Models",
                     values=model_labels,
-                    value=[
-                        model_list.index(x)
-                        for x in model_list
-                        if (show_recommended and self.all_models[x].recommended) or self.all_models[x].installed
-                    ],
-                    max_height=len(model_list) // columns + 1,
+                    value=self._preselected(model_list),
+                    max_height=rows,
                     relx=4,
                     scroll_exit=True,
                 ),
@@ -334,7 +337,7 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
     ### Tab for arbitrary diffusers widgets ###
     def add_pipeline_widgets(
         self,
-        model_type: ModelType = ModelType.Main,
+        model_type: ModelType,
         window_width: int = 120,
         **kwargs,
     ) -> dict[str, npyscreen.widget]:
@@ -349,25 +352,79 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
 
         return widgets
 
+    def _preselected(self, model_list: list[str]) -> list[int]:
+        """Indices of the models in model_list that are checked when their table is first shown"""
+        preselected = self._preselected_names
+        return [i for i, x in enumerate(model_list) if x in preselected]
+
+    def _model_table_layout(self, model_list: list[str], window_width: int) -> tuple[int, int]:
+        """Return the number of columns and the height of the selection table for model_list"""
+        labels = self.model_labels
+        max_width = max(len(labels[x]) for x in model_list)
+        columns = window_width // (max_width + 8)  # 8 characters for "[x] " and padding
+        columns = min(len(model_list), columns) or 1
+        return columns, len(model_list) // columns + 1
+
+    def _tab_models(self, tab: int) -> list[str]:
+        """Keys of the models listed on a tab, in display order"""
+        if tab == 0:
+            return self._starter_keys
+        exclude = self.starter_models if tab == 1 else set()
+        return [x for x in self._models_by_type.get(self._tab_model_types[tab], []) if x not in exclude]
+
+    def _tab_height(self, tab: int, window_width: int) -> int:
+        """
+        Number of rows occupied by a tab's widgets, following the layout of
+        add_starter_pipelines() and add_model_widgets(). Used to reserve room
+        for tabs that have not been built yet.
+        """
+        model_list = self._tab_models(tab)
+        if tab == 0:
+            # title (sharing a row with the table), table, blank line
+            return 1 + len(model_list) + 1 + 1
+        height = 1 + 4  # blank line and download_ids
+        if model_list:
+            _, rows = self._model_table_layout(model_list, window_width)
+            height += 2 + rows  # two-line title and table
+            if len(model_list) > MAX_OTHER_MODELS:
+                height += 1  # truncation warning
+        return height
+
+    def _build_tab(self, tab: int):
+        """Build the widgets of a tab that was not built when the form was created"""
+        page = self._widgets__
+        first_new = len(page)
+        saved_rely = self.nextrely
+        self.nextrely = self._top_of_table
+        self._tab_widgets[tab] = self._tab_builders[tab]()
+        self.nextrely = saved_rely
+
+        # move the new widgets in with the other tables, ahead of the log box and
+        # buttons, so that <N>ext and <P>revious visit them in screen order
+        if self._widgets__ is page and len(page) > first_new:
+            new_widgets = page[first_new:]
+            del page[first_new:]
+            page[self._table_position : self._table_position] = new_widgets
+            if self.editw >= self._table_position:
+                self.editw += len(new_widgets)
+
     def resize(self):
+        self._term_size = get_terminal_size()
         super().resize()
-        if s := self.starter_pipelines.get("models_selected"):
-            keys = [x for x in self.all_models.keys() if x in self.starter_models]
-            s.values = [self.model_labels[x] for x in keys]
+        self._wrapper.width = self.monitor.entry_widget.width
+        self.model_labels = self._get_model_labels()
+        if (starters := self._tab_widgets[0]) and (s := starters.get("models_selected")):
+            s.values = [self.model_labels[x] for x in self._starter_keys]
 
     def _toggle_tables(self, value=None):
         selected_tab = value[0]
-        widgets = [
-            self.starter_pipelines,
-            self.pipeline_models,
-            self.controlnet_models,
-            self.t2i_models,
-            self.ipadapter_models,
-            self.lora_models,
-            self.ti_models,
-        ]
+        if self._tab_widgets[selected_tab] is None:
+            self._build_tab(selected_tab)
+        widgets = self._tab_widgets
 
         for group in widgets:
+            if group is None:
+                continue
             for _k, v in group.items():
                 try:
                     v.hidden = True
@@ -385,33 +442,32 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         self.display()
 
     def _get_model_labels(self) -> dict[str, str]:
-        window_width, window_height = get_terminal_size()
+        window_width, window_height = self._term_size
+        if labels := self._label_cache.get(window_width):
+            return labels
+
         checkbox_width = 4
         spacing_width = 2
 
         models = self.all_models
         label_width = max([len(models[x].name) for x in models])
         description_width = window_width - label_width - checkbox_width - spacing_width
+        fmt = f"%-{label_width}s %s"
 
         result = {}
-        for x in models.keys():
-            description = models[x].description
-            description = (
-                description[0 : description_width - 3] + "..."
-                if description and len(description) > description_width
-                else description
-                if description
-                else ""
-            )
-            result[x] = f"%-{label_width}s %s" % (models[x].name, description)
+        for x, info in models.items():
+            result[x] = fmt % (info.name, _truncate(info.description or "", description_width))
+        self._label_cache[window_width] = result
         return result
 
     def _get_columns(self) -> int:
-        window_width, window_height = get_terminal_size()
+        window_width, window_height = self._term_size
         cols = 4 if window_width > 240 else 3 if window_width > 160 else 2 if window_width > 80 else 1
         return min(cols, len(self.installed_models))
 
     def confirm_deletions(self, selections: InstallSelections) -> bool:
+        from invokeai.backend.model_management import ModelManager
+
         remove_models = selections.remove_models
         if len(remove_models) > 0:
             mods = "\n".join([ModelManager.parse_key(x)[0] for x in remove_models])
@@ -422,29 +478,24 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
             return True
 
     def on_execute(self):
+        from invokeai.backend.install.model_install_backend import InstallSelections
+
         self.marshall_arguments()
         app = self.parentApp
-        if not self.confirm_deletions(app.install_selections):
+        selections = app.install_selections
+        if not (selections.install_models or selections.remove_models):
+            self.monitor.entry_widget.buffer(["Nothing to do."], scroll_end=True)
+            self.display()
+            return
+
+        if not self.confirm_deletions(selections):
             return
 
         self.monitor.entry_widget.buffer(["Processing..."], scroll_end=True)
         self.ok_button.hidden = True
         self.display()
 
-        # TO DO: Spawn a worker thread, not a subprocess
-        parent_conn, child_conn = Pipe()
-        p = Process(
-            target=process_and_execute,
-            kwargs={
-                "opt": app.program_opts,
-                "selections": app.install_selections,
-                "conn_out": child_conn,
-            },
-        )
-        p.start()
-        child_conn.close()
-        self.subprocess_connection = parent_conn
-        self.subprocess = p
+        self.subprocess_connection = app.submit_job(selections)
         app.install_selections = InstallSelections()
 
     def on_back(self):
@@ -473,10 +524,11 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
             return
 
         monitor_widget = self.monitor.entry_widget
+        lines = []
+        done = False
         while c.poll():
             try:
-                data = c.recv_bytes().decode("utf-8")
-                data.strip("\n")
+                data = c.recv_bytes().decode("utf-8", "replace").rstrip("\n")
 
                 # processing child is requesting user input to select the
                 # right configuration file
@@ -486,24 +538,25 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
 
                 # processing child is done
                 elif data == "*done*":
-                    self._close_subprocess_and_regenerate_form()
+                    done = True
                     break
 
-                # update the log message box
+                # collect lines for the log message box
                 else:
-                    data = make_printable(data)
-                    data = data.replace("[A", "")
-                    monitor_widget.buffer(
-                        textwrap.wrap(
-                            data,
-                            width=monitor_widget.width,
-                            subsequent_indent="   ",
-                        ),
-                        scroll_end=True,
-                    )
-                    self.display()
+                    for line in data.splitlines():
+                        line = make_printable(line)
+                        line = line.replace("[A", "")
+                        lines.extend(self._wrapper.wrap(line))
             except (EOFError, OSError):
                 self.subprocess_connection = None
+                break
+
+        # redraw once for everything received during this idle period
+        if lines:
+            monitor_widget.buffer(lines, scroll_end=True)
+            self.display()
+        if done:
+            self._close_subprocess_and_regenerate_form()
 
     def _return_v2_config(self, model_path: str):
         c = self.subprocess_connection
@@ -513,7 +566,7 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
 
     def _close_subprocess_and_regenerate_form(self):
         app = self.parentApp
-        self.subprocess_connection.close()
+        # the connection belongs to the worker process, which stays up for the next job
         self.subprocess_connection = None
         self.monitor.entry_widget.buffer(["** Action Complete **"])
         self.display()
@@ -546,23 +599,28 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         """
         selections = self.parentApp.install_selections
         all_models = self.all_models
-
-        # Defined models (in INITIAL_CONFIG.yaml or models.yaml) to add/remove
-        ui_sections = [
-            self.starter_pipelines,
-            self.pipeline_models,
-            self.controlnet_models,
-            self.t2i_models,
-            self.ipadapter_models,
-            self.lora_models,
-            self.ti_models,
-        ]
-        for section in ui_sections:
-            if "models_selected" not in section:
+        installed_names = self._installed_names
+
+        # Defined models (in INITIAL_CONFIG.yaml or models.yaml) to add/remove.
+        # Tabs that were never opened keep their initial selections.
+        ui_sections = self._tab_widgets
+        for tab, section in enumerate(ui_sections):
+            if section is None:
+                models = self._tab_models(tab)
+                selected = set(self._preselected(models))
+            elif "models_selected" in section:
+                models = section["models"]
+                selected = set(section["models_selected"].value)
+            else:
                 continue
-            selected = {section["models"][x] for x in section["models_selected"].value}
-            models_to_install = [x for x in selected if not self.all_models[x].installed]
-            models_to_remove = [x for x in section["models"] if x not in selected and self.all_models[x].installed]
+            models_to_install = []
+            models_to_remove = []
+            for i, x in enumerate(models):
+                installed = x in installed_names
+                if i in selected and not installed:
+                    models_to_install.append(x)
+                elif i not in selected and installed:
+                    models_to_remove.append(x)
             selections.remove_models.extend(models_to_remove)
             selections.install_models.extend(
                 all_models[x].path or all_models[x].repo_id
@@ -572,7 +630,7 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
 
         # models located in the 'download_ids" section
         for section in ui_sections:
-            if downloads := section.get("download_ids"):
+            if section and (downloads := section.get("download_ids")):
                 selections.install_models.extend(downloads.value.split())
 
         # NOT NEEDED - DONE IN BACKEND NOW
@@ -595,13 +653,79 @@ class addModelsForm(CyclingForm, npyscreen.FormMultiPage):
         #             selections.install_models.append(repo_id)
 
 
+class SocketConnection:
+    """
+    Message channel over one end of a socketpair. Implements the subset of
+    multiprocessing.connection.Connection used by the installer: messages
+    are framed with a length prefix, and poll() reads everything the socket
+    has ready in a single call so that bursts of log output are picked up
+    together.
+    """
+
+    HEADER = struct.Struct("!I")
+    READ_SIZE = 65536
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._buffer = bytearray()
+        self._eof = False
+
+    def send_bytes(self, data: bytes):
+        self.sock.sendall(self.HEADER.pack(len(data)) + data)
+
+    def poll(self) -> bool:
+        """Return True if a message (or end of file) is ready to be received without blocking"""
+        while not self._message_ready() and not self._eof:
+            readable, _, _ = select.select([self.sock], [], [], 0)
+            if not readable:
+                break
+            self._read()
+        return self._message_ready() or self._eof
+
+    def recv_bytes(self) -> bytes:
+        while not self._message_ready():
+            if self._eof:
+                raise EOFError
+            self._read()
+        (length,) = self.HEADER.unpack_from(self._buffer)
+        end = self.HEADER.size + length
+        message = bytes(self._buffer[self.HEADER.size : end])
+        del self._buffer[:end]
+        return message
+
+    def close(self):
+        self.sock.close()
+
+    def _read(self):
+        data = self.sock.recv(self.READ_SIZE)
+        if data:
+            self._buffer += data
+        else:
+            self._eof = True
+
+    def _message_ready(self) -> bool:
+        if len(self._buffer) < self.HEADER.size:
+            return False
+        (length,) = self.HEADER.unpack_from(self._buffer)
+        return len(self._buffer) >= self.HEADER.size + length
+
+
 class AddModelApplication(npyscreen.NPSAppManaged):
     def __init__(self, opt):
+        from invokeai.backend.install.model_install_backend import InstallSelections
+
         super().__init__()
         self.program_opts = opt
         self.user_cancelled = False
         # self.autoload_pending = True
         self.install_selections = InstallSelections()
+        # resolved once; the config property walks the filesystem on every access
+        self.model_conf_path = config.model_conf_path
+        self.worker = None
+        self.worker_connection = None
+        self.job_queue = None
+        self._job_memory = None
+        self.start_worker()
 
     def onStart(self):
         npyscreen.setTheme(npyscreen.Themes.DefaultTheme)
@@ -612,28 +736,123 @@ class AddModelApplication(npyscreen.NPSAppManaged):
             cycle_widgets=False,
         )
 
+    def start_worker(self):
+        """
+        Start the process that performs installations and removals. It is
+        started ahead of time so that its imports overlap with the user's
+        browsing, and it is kept alive to service later jobs.
+        """
+        parent_sock, child_sock = socket.socketpair()
+        child_conn = SocketConnection(child_sock)
+        self.job_queue = Queue()
+        self.worker = Process(
+            target=_worker_main,
+            kwargs={
+                "opt": self.program_opts,
+                "job_queue": self.job_queue,
+                "conn_out": child_conn,
+            },
+        )
+        self.worker.start()
+        child_conn.close()
+        self.worker_connection = SocketConnection(parent_sock)
+
+    def submit_job(self, selections: InstallSelections) -> SocketConnection:
+        """
+        Queue an install job, restarting the worker if it has died. Returns the connection to monitor.
+
+        The selections are passed to the worker as JSON in a shared memory segment rather than
+        being pickled through the queue. Jobs run one at a time, so the segment of the previous
+        job is released here.
+        """
+        if not (self.worker and self.worker.is_alive()):
+            self.stop_worker()
+            self.start_worker()
+        self._release_job_memory()
+        payload = json.dumps(vars(selections), default=str).encode("utf-8")
+        self._job_memory = shared_memory.SharedMemory(create=True, size=len(payload))
+        self._job_memory.buf[: len(payload)] = payload
+        self.job_queue.put((self._job_memory.name, len(payload)))
+        return self.worker_connection
+
+    def stop_worker(self):
+        """Tell the worker to exit once its current job is finished, and wait for it."""
+        if self.worker is not None:
+            if self.worker.is_alive():
+                self.job_queue.put(None)
+                self._drain_worker_connection()
+            self.worker_connection.close()
+            self.worker.join()
+            self.worker = None
+            self.worker_connection = None
+            self.job_queue = None
+        self._release_job_memory()
+
+    def _drain_worker_connection(self):
+        """
+        Read from the worker until it closes its end of the connection. Closing ours first would make
+        the worker's next write to stderr fail in the middle of a job. The form is gone by now, so log
+        messages are passed on to stderr and prediction type questions are answered with "guess".
+        """
+        conn = self.worker_connection
+        while True:
+            try:
+                data = conn.recv_bytes().decode("utf-8", "replace")
+            except (EOFError, OSError):
+                return
+            if data.startswith("*need v2 config"):
+                conn.send_bytes("guess".encode("utf-8"))
+            elif data != "*done*":
+                sys.stderr.write(data)
+
+    def _release_job_memory(self):
+        if self._job_memory is not None:
+            self._job_memory.close()
+            self._job_memory.unlink()
+            self._job_memory = None
+
 
 class StderrToMessage:
-    def __init__(self, connection: Connection):
+    """
+    File-like object that forwards writes to the TUI. Writes are buffered
+    and sent as a single message at each newline, on flush(), or once
+    the buffer exceeds MAX_BUFFER characters.
+    """
+
+    MAX_BUFFER = 4096
+
+    def __init__(self, connection: SocketConnection):
         self.connection = connection
+        self._pending: list[str] = []
+        self._pending_size = 0
 
     def write(self, data: str):
-        self.connection.send_bytes(data.encode("utf-8"))
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if "\n" in data or self._pending_size > self.MAX_BUFFER:
+            self.flush()
 
     def flush(self):
-        pass
+        if self._pending:
+            self.connection.send_bytes("".join(self._pending).encode("utf-8"))
+            self._pending.clear()
+            self._pending_size = 0
 
 
 # --------------------------------------------------------
-def ask_user_for_prediction_type(model_path: Path, tui_conn: Connection = None) -> SchedulerPredictionType:
+def ask_user_for_prediction_type(model_path: Path, tui_conn: SocketConnection = None) -> SchedulerPredictionType:
     if tui_conn:
-        logger.debug("Waiting for user response...")
+        from invokeai.backend.util.logging import InvokeAILogger
+
+        InvokeAILogger.get_logger().debug("Waiting for user response...")
         return _ask_user_for_pt_tui(model_path, tui_conn)
     else:
         return _ask_user_for_pt_cmdline(model_path)
 
 
 def _ask_user_for_pt_cmdline(model_path: Path) -> Optional[SchedulerPredictionType]:
+    from invokeai.backend.install.model_install_backend import SchedulerPredictionType
+
     choices = [SchedulerPredictionType.Epsilon, SchedulerPredictionType.VPrediction, None]
     print(
         f"""
@@ -659,7 +878,9 @@ Please select the scheduler prediction type of the checkpoint named {model_path.
     return choice
 
 
-def _ask_user_for_pt_tui(model_path: Path, tui_conn: Connection) -> SchedulerPredictionType:
+def _ask_user_for_pt_tui(model_path: Path, tui_conn: SocketConnection) -> SchedulerPredictionType:
+    from invokeai.backend.install.model_install_backend import SchedulerPredictionType
+
     tui_conn.send_bytes(f"*need v2 config for:{model_path}".encode("utf-8"))
     # note that we don't do any status checking here
     response = tui_conn.recv_bytes().decode("utf-8")
@@ -679,8 +900,11 @@ def _ask_user_for_pt_tui(model_path: Path, tui_conn: Connection) -> SchedulerPre
 def process_and_execute(
     opt: Namespace,
     selections: InstallSelections,
-    conn_out: Connection = None,
+    conn_out: SocketConnection = None,
 ):
+    from invokeai.backend.install.model_install_backend import ModelInstall
+    from invokeai.backend.util.logging import InvokeAILogger
+
     # need to reinitialize config in subprocess
     config = InvokeAIAppConfig.get_config()
     args = ["--root", opt.root] if opt.root else []
@@ -699,12 +923,48 @@ def process_and_execute(
     installer.install(selections)
 
     if conn_out:
+        translator.flush()
         conn_out.send_bytes("*done*".encode("utf-8"))
-        conn_out.close()
+
+
+def _worker_main(
+    opt: Namespace,
+    job_queue: Queue,
+    conn_out: SocketConnection,
+):
+    """Run queued install jobs in the worker process until a None job is received"""
+    # Ctrl-C reaches the whole process group; leave it to the TUI, which terminates us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # load the backend while the user is still making selections
+    import invokeai.backend.install.model_install_backend  # noqa: F401
+
+    while (job := job_queue.get()) is not None:
+        process_and_execute(opt, _read_selections(*job), conn_out)
+    conn_out.close()
+
+
+def _read_selections(name: str, length: int) -> InstallSelections:
+    """Read the InstallSelections that AddModelApplication.submit_job() left in shared memory"""
+    from invokeai.backend.install.model_install_backend import InstallSelections
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = json.loads(bytes(shm.buf[:length]).decode("utf-8"))
+    finally:
+        shm.close()
+    return InstallSelections(**data)
 
 
 # --------------------------------------------------------
 def select_and_download_models(opt: Namespace):
+    import torch
+
+    from invokeai.backend.install.model_install_backend import InstallSelections, ModelInstall
+    from invokeai.backend.util import choose_precision, choose_torch_device
+    from invokeai.backend.util.logging import InvokeAILogger
+
+    logger = InvokeAILogger.get_logger()
     precision = "float32" if opt.full_precision else choose_precision(torch.device(choose_torch_device()))
     config.precision = precision
     installer = ModelInstall(config, prediction_type_helper=ask_user_for_prediction_type)
@@ -734,16 +994,27 @@ def select_and_download_models(opt: Namespace):
         try:
             installApp.run()
         except KeyboardInterrupt as e:
-            if hasattr(installApp, "main_form"):
-                if installApp.main_form.subprocess and installApp.main_form.subprocess.is_alive():
-                    logger.info("Terminating subprocesses")
-                    installApp.main_form.subprocess.terminate()
-                    installApp.main_form.subprocess = None
+            if installApp.worker and installApp.worker.is_alive():
+                logger.info("Terminating subprocesses")
+                installApp.worker.terminate()
+                installApp.worker = None
             raise e
+        finally:
+            installApp.stop_worker()
         process_and_execute(opt, installApp.install_selections)
 
 
 # -------------------------------------
+def _model_type(value: str) -> str:
+    """Validate the --list-models argument; the backend is only imported when the option is given"""
+    from invokeai.backend.model_management import ModelType
+
+    model_types = [x.value for x in ModelType]
+    if value not in model_types:
+        raise argparse.ArgumentTypeError(f"invalid choice: '{value}' (choose from {', '.join(model_types)})")
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(description="InvokeAI model downloader")
     parser.add_argument(
@@ -778,8 +1049,9 @@ def main():
     )
     parser.add_argument(
         "--list-models",
-        choices=[x.value for x in ModelType],
-        help="list installed models",
+        type=_model_type,
+        metavar="MODEL_TYPE",
+        help="list installed models of type MODEL_TYPE",
     )
     parser.add_argument(
         "--config_file",
@@ -798,6 +1070,9 @@ def main():
     )
     opt = parser.parse_args()
 
+    # imported after parsing so that --help does not load the backend
+    from invokeai.backend.util.logging import InvokeAILogger
+
     invoke_args = []
     if opt.root:
         invoke_args.extend(["--root", opt.root])
@@ -0,0 +1,69 @@
+"""
+Test the INITIAL_MODELS.yaml parse cache used by ModelInstall.
+"""
+import os
+
+import pytest
+from omegaconf import OmegaConf
+
+import invokeai.backend.install.model_install_backend as backend
+from invokeai.app.services.config import InvokeAIAppConfig
+from invokeai.backend.install.model_install_backend import ModelInstall, _load_yaml_cached
+
+INITIAL_MODELS = """
+sd-1/main/model-one:
+   description: First test model
+   repo_id: test/model-one
+   recommended: True
+sd-2/main/model-two:
+   description: Second test model
+   repo_id: test/model-two
+   subfolder: fp16
+"""
+
+
+class StubModelManager:
+    def list_models(self):
+        return []
+
+
+@pytest.fixture
+def models_yaml(tmp_path, monkeypatch):
+    path = tmp_path / "INITIAL_MODELS.yaml"
+    path.write_text(INITIAL_MODELS)
+    monkeypatch.setattr(backend, "_YAML_CACHE", {})
+    monkeypatch.setattr(backend, "Dataset_path", path)
+    return path
+
+
+def test_cache_hit_on_unchanged_file(models_yaml):
+    first = _load_yaml_cached(models_yaml)
+    assert _load_yaml_cached(models_yaml) is first
+
+
+def test_reparse_after_size_change(models_yaml):
+    first = _load_yaml_cached(models_yaml)
+    models_yaml.write_text(INITIAL_MODELS + "sd-1/main/model-three:\n   repo_id: test/model-three\n")
+    second = _load_yaml_cached(models_yaml)
+    assert second is not first
+    assert "sd-1/main/model-three" in second
+
+
+def test_reparse_after_mtime_change(models_yaml):
+    first = _load_yaml_cached(models_yaml)
+    st = os.stat(models_yaml)
+    os.utime(models_yaml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _load_yaml_cached(models_yaml) is not first
+
+
+def test_all_models_does_not_mutate_cache(models_yaml):
+    before = OmegaConf.to_container(_load_yaml_cached(models_yaml))
+    installer = ModelInstall(InvokeAIAppConfig(), model_manager=StubModelManager(), access_token="none")
+    models = installer.all_models()
+    assert models["sd-1/main/model-one"].name == "model-one"
+    assert models["sd-2/main/model-two"].repo_id == "test/model-two:fp16"
+
+    # a second installer shares the cached parse and must see it untouched
+    assert OmegaConf.to_container(_load_yaml_cached(models_yaml)) == before
+    models = ModelInstall(InvokeAIAppConfig(), model_manager=StubModelManager(), access_token="none").all_models()
+    assert models["sd-2/main/model-two"].repo_id == "test/model-two:fp16"
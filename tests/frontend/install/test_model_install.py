@@ -0,0 +1,180 @@
+"""
+Test the channels between the model installer TUI and its worker.
+"""
+import multiprocessing
+import queue
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from invokeai.backend.install.model_install_backend import InstallSelections
+from invokeai.frontend.install.model_install import (
+    AddModelApplication,
+    SocketConnection,
+    StderrToMessage,
+    _read_selections,
+)
+
+
+@pytest.fixture
+def channel():
+    ours, theirs = socket.socketpair()
+    conn = SocketConnection(ours)
+    yield conn, theirs
+    conn.close()
+    theirs.close()
+
+
+def test_message_split_across_reads(channel):
+    conn, peer = channel
+    frame = SocketConnection.HEADER.pack(11) + b"hello world"
+
+    peer.sendall(frame[:2])
+    assert not conn.poll()
+    peer.sendall(frame[2:8])
+    assert not conn.poll()
+    peer.sendall(frame[8:])
+    assert conn.poll()
+    assert conn.recv_bytes() == b"hello world"
+    assert not conn.poll()
+
+
+def test_recv_bytes_across_reads(channel):
+    conn, peer = channel
+    conn.READ_SIZE = 3
+    SocketConnection(peer).send_bytes(b"first")
+    SocketConnection(peer).send_bytes(b"second")
+    assert conn.recv_bytes() == b"first"
+    assert conn.recv_bytes() == b"second"
+
+
+def test_payload_larger_than_read_size(channel):
+    conn, peer = channel
+    payload = bytes(range(256)) * (3 * SocketConnection.READ_SIZE // 256 + 1)
+    sender = threading.Thread(target=SocketConnection(peer).send_bytes, args=(payload,))
+    sender.start()
+    received = conn.recv_bytes()
+    sender.join()
+    assert received == payload
+
+
+def test_eof(channel):
+    conn, peer = channel
+    SocketConnection(peer).send_bytes(b"last")
+    peer.close()
+    assert conn.poll()
+    assert conn.recv_bytes() == b"last"
+    assert conn.poll()
+    with pytest.raises(EOFError):
+        conn.recv_bytes()
+
+
+def test_eof_inside_message(channel):
+    conn, peer = channel
+    peer.sendall(SocketConnection.HEADER.pack(10) + b"trunc")
+    peer.close()
+    assert conn.poll()
+    with pytest.raises(EOFError):
+        conn.recv_bytes()
+
+
+def test_stderr_flushes_on_newline(channel):
+    conn, peer = channel
+    stderr = StderrToMessage(SocketConnection(peer))
+    stderr.write("partial ")
+    assert not conn.poll()
+    stderr.write("line\n")
+    assert conn.recv_bytes() == b"partial line\n"
+
+
+def test_stderr_flushes_on_flush(channel):
+    conn, peer = channel
+    stderr = StderrToMessage(SocketConnection(peer))
+    stderr.write("50%")
+    assert not conn.poll()
+    stderr.flush()
+    assert conn.recv_bytes() == b"50%"
+    stderr.flush()
+    assert not conn.poll()
+
+
+def test_stderr_flushes_past_max_buffer(channel):
+    conn, peer = channel
+    stderr = StderrToMessage(SocketConnection(peer))
+    chunk = "x" * (StderrToMessage.MAX_BUFFER // 2)
+    stderr.write(chunk)
+    stderr.write(chunk)
+    assert not conn.poll()
+    stderr.write("y")
+    assert conn.recv_bytes() == (chunk * 2 + "y").encode("utf-8")
+
+
+class StubWorker:
+    def is_alive(self):
+        return True
+
+
+def test_selections_round_trip():
+    app = AddModelApplication.__new__(AddModelApplication)
+    app.worker = StubWorker()
+    app.worker_connection = None
+    app.job_queue = queue.Queue()
+    app._job_memory = None
+
+    selections = InstallSelections(
+        install_models=[
+            "stabilityai/sdxl-vae",
+            "https://example.com/model.safetensors",
+            Path("/models/lora.safetensors"),
+        ],
+        remove_models=["sd-1/main/stable-diffusion-v1-5"],
+    )
+    try:
+        app.submit_job(selections)
+        received = _read_selections(*app.job_queue.get_nowait())
+    finally:
+        app._release_job_memory()
+
+    assert received == InstallSelections(
+        install_models=["stabilityai/sdxl-vae", "https://example.com/model.safetensors", "/models/lora.safetensors"],
+        remove_models=["sd-1/main/stable-diffusion-v1-5"],
+    )
+
+
+def _slow_worker(job_queue, conn_out, log_path):
+    """Stand-in for _worker_main() whose jobs write to stderr for a while"""
+    stderr = StderrToMessage(conn_out)
+    while job_queue.get() is not None:
+        for step in range(5):
+            stderr.write(f"step {step}\n")
+            with open(log_path, "a") as log:
+                print(f"step {step}", file=log)
+            time.sleep(0.05)
+        conn_out.send_bytes("*done*".encode("utf-8"))
+    conn_out.close()
+
+
+def test_stop_worker_lets_job_finish(tmp_path):
+    # spawn, as the installer does, so that the worker does not inherit the parent's end of the socket
+    mp = multiprocessing.get_context("spawn")
+    log_path = tmp_path / "steps.log"
+    parent_sock, child_sock = socket.socketpair()
+    app = AddModelApplication.__new__(AddModelApplication)
+    app.job_queue = mp.Queue()
+    app.worker = mp.Process(target=_slow_worker, args=(app.job_queue, SocketConnection(child_sock), log_path))
+    app.worker.start()
+    child_sock.close()
+    app.worker_connection = SocketConnection(parent_sock)
+    app._job_memory = None
+
+    app.job_queue.put("job")
+    assert app.worker_connection.recv_bytes() == b"step 0\n"
+    worker = app.worker
+    app.stop_worker()
+
+    assert worker.exitcode == 0
+    assert log_path.read_text().splitlines() == [f"step {step}" for step in range(5)]
+    assert app.worker is None